@@ -0,0 +1,321 @@
+"""
+Activity Calendar
+Compact per-learner activity calendar stored as packed bit arrays (one bit per day)
+"""
+
+import re
+import struct
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+# ============================================
+# CONFIGURATION
+# ============================================
+
+CALENDAR_PATH = Path("activity_calendar.bin")
+ACTIVITY_LOG_PATH = Path("activity_log.md")
+DEFAULT_LEARNER = "default"
+
+# Bit 0 of every calendar is a Monday on or after this date, so week
+# buckets are always aligned 7-bit windows
+EPOCH = date(2000, 1, 3)
+
+MAGIC = b"ACAL"
+VERSION = 1
+HEADER = struct.Struct("<4sBI")     # magic, version, learner count
+RECORD = struct.Struct("<HII")      # name length, base day, payload bytes
+
+WEEK_MASK = (1 << 7) - 1
+
+LOG_ENTRY = re.compile(r"- \*\*(\d{4}-\d{2}-\d{2})\*\*")
+
+try:
+    _popcount = int.bit_count
+except AttributeError:  # Python < 3.10
+    def _popcount(value):
+        return bin(value).count("1")
+
+
+def _day_index(day):
+    """Days since EPOCH for a date"""
+    return (day - EPOCH).days
+
+
+def _range_mask(start, end):
+    """Mask with bits start..end (inclusive) set"""
+    if end < start:
+        return 0
+    return ((1 << (end - start + 1)) - 1) << start
+
+
+def _longest_run(bits):
+    """Length of the longest run of set bits.
+
+    Uses doubling: runs[k] has bit i set iff bits i..i+k-1 are all set, so the
+    answer is found with O(log n) whole-integer AND/shift operations instead of
+    walking individual days.
+    """
+    if not bits:
+        return 0
+
+    runs = [(1, bits)]
+    while True:
+        width, mask = runs[-1]
+        doubled = mask & (mask >> width)
+        if not doubled:
+            break
+        runs.append((width * 2, doubled))
+
+    length, acc = runs.pop()
+    for width, mask in reversed(runs):
+        extended = acc & (mask >> length)
+        if extended:
+            acc = extended
+            length += width
+    return length
+
+
+class ActivityCalendar:
+    """Activity bitsets keyed by learner.
+
+    Each learner is stored as ``(base, bits)`` where ``base`` is the day index
+    (relative to EPOCH, always a multiple of 7) of bit 0 and ``bits`` is a
+    Python int used as an arbitrary-length bit array.
+    """
+
+    def __init__(self):
+        self.learners = {}
+
+    # ============================================
+    # PERSISTENCE
+    # ============================================
+
+    @classmethod
+    def load(cls, path=CALENDAR_PATH):
+        """Load a calendar from its packed binary file"""
+        calendar = cls()
+        data = Path(path).read_bytes()
+
+        magic, version, count = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} activity calendar")
+
+        offset = HEADER.size
+        for _ in range(count):
+            name_len, base, size = RECORD.unpack_from(data, offset)
+            offset += RECORD.size
+            name = data[offset:offset + name_len].decode("utf-8")
+            offset += name_len
+            bits = int.from_bytes(data[offset:offset + size], "little")
+            offset += size
+            calendar.learners[name] = (base, bits)
+
+        return calendar
+
+    def save(self, path=CALENDAR_PATH):
+        """Write the calendar as a packed binary file"""
+        parts = [HEADER.pack(MAGIC, VERSION, len(self.learners))]
+
+        for name in sorted(self.learners):
+            base, bits = self.learners[name]
+            encoded = name.encode("utf-8")
+            payload = bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+            parts.append(RECORD.pack(len(encoded), base, len(payload)))
+            parts.append(encoded)
+            parts.append(payload)
+
+        Path(path).write_bytes(b"".join(parts))
+
+    @classmethod
+    def from_activity_log(cls, log_path=ACTIVITY_LOG_PATH, learner=DEFAULT_LEARNER):
+        """Build a calendar by parsing the bullets in activity_log.md"""
+        calendar = cls()
+        calendar.sync_from_log(log_path, learner)
+        return calendar
+
+    def sync_from_log(self, log_path=ACTIVITY_LOG_PATH, learner=DEFAULT_LEARNER):
+        """Mark log days newer than the latest active day; returns the number added.
+
+        activity_log.md is append-only and chronological, so the log is walked
+        backwards and only entries after the calendar's high-water mark are
+        parsed.
+        """
+        log_path = Path(log_path)
+        if not log_path.exists():
+            return 0
+
+        latest = self.last_active(learner)
+        added = 0
+        for line in reversed(log_path.read_text(encoding="utf-8").splitlines()):
+            match = LOG_ENTRY.match(line)
+            if not match:
+                continue
+            day = datetime.strptime(match.group(1), "%Y-%m-%d").date()
+            if latest is not None and day <= latest:
+                break
+            self.mark(day, learner)
+            added += 1
+
+        return added
+
+    # ============================================
+    # UPDATES
+    # ============================================
+
+    def mark(self, day, learner=DEFAULT_LEARNER):
+        """Record activity for a learner on a given day"""
+        index = _day_index(day)
+        if index < 0:
+            raise ValueError(f"{day} is before the calendar epoch {EPOCH}")
+
+        base, bits = self.learners.get(learner, (None, 0))
+        if base is None:
+            base = index - index % 7
+        elif index < base:
+            new_base = index - index % 7
+            bits <<= base - new_base
+            base = new_base
+
+        self.learners[learner] = (base, bits | (1 << (index - base)))
+
+    def last_active(self, learner=DEFAULT_LEARNER):
+        """Most recent active day for a learner, or None"""
+        base, bits = self.learners.get(learner, (0, 0))
+        if not bits:
+            return None
+        return EPOCH + timedelta(days=base + bits.bit_length() - 1)
+
+    def is_active(self, day, learner=DEFAULT_LEARNER):
+        """Check whether a learner was active on a given day"""
+        base, bits = self.learners.get(learner, (0, 0))
+        index = _day_index(day) - base
+        return index >= 0 and bool(bits >> index & 1)
+
+    # ============================================
+    # QUERIES
+    # ============================================
+
+    def _window(self, learner, start, end):
+        """Bits for start..end (inclusive) shifted so start is bit 0"""
+        base, bits = self.learners.get(learner, (0, 0))
+        lo = _day_index(start) - base
+        hi = _day_index(end) - base
+        if lo < 0:
+            # Days before the learner's first bit are inactive
+            bits <<= -lo
+            hi -= lo
+            lo = 0
+        return (bits >> lo) & _range_mask(0, hi - lo)
+
+    def current_streak(self, today, learner=DEFAULT_LEARNER):
+        """Consecutive active days ending on ``today``"""
+        base, bits = self.learners.get(learner, (0, 0))
+        index = _day_index(today) - base
+        if index < 0:
+            return 0
+
+        gaps = ~bits & _range_mask(0, index)
+        if not gaps:
+            return index + 1
+        return index - (gaps.bit_length() - 1)
+
+    def longest_streak(self, learner=DEFAULT_LEARNER, start=None, end=None):
+        """Longest run of active days, optionally limited to start..end"""
+        base, bits = self.learners.get(learner, (0, 0))
+        if start is not None or end is not None:
+            start = start or EPOCH + timedelta(days=base)
+            end = end or EPOCH + timedelta(days=base + max(bits.bit_length() - 1, 0))
+            bits = self._window(learner, start, end)
+        return _longest_run(bits)
+
+    def missed_days(self, start, end, learner=DEFAULT_LEARNER):
+        """Dates in start..end (inclusive) with no recorded activity"""
+        gaps = ~self._window(learner, start, end) & _range_mask(0, (end - start).days)
+
+        missed = []
+        while gaps:
+            lowest = gaps & -gaps
+            missed.append(start + timedelta(days=lowest.bit_length() - 1))
+            gaps ^= lowest
+        return missed
+
+    def active_count(self, start, end, learner=DEFAULT_LEARNER):
+        """Number of active days in start..end (inclusive)"""
+        return _popcount(self._window(learner, start, end))
+
+    def weekly_density(self, start, end, learner=DEFAULT_LEARNER):
+        """Active days per Monday-aligned week, as {week_start: count}"""
+        if end < start:
+            return {}
+
+        first = start - timedelta(days=start.weekday())
+        window = self._window(learner, first, end)
+        window &= ~_range_mask(0, (start - first).days - 1)
+
+        density = {}
+        week = first
+        while week <= end:
+            density[week] = _popcount(window & WEEK_MASK)
+            window >>= 7
+            week += timedelta(days=7)
+        return density
+
+    def monthly_density(self, start, end, learner=DEFAULT_LEARNER):
+        """Active days per calendar month, as {(year, month): count}"""
+        window = self._window(learner, start, end)
+
+        density = {}
+        cursor = start
+        while cursor <= end:
+            if cursor.month == 12:
+                next_month = date(cursor.year + 1, 1, 1)
+            else:
+                next_month = date(cursor.year, cursor.month + 1, 1)
+            width = (min(next_month, end + timedelta(days=1)) - cursor).days
+            density[(cursor.year, cursor.month)] = _popcount(window & ((1 << width) - 1))
+            window >>= width
+            cursor = next_month
+        return density
+
+
+def sync_calendar(path=CALENDAR_PATH, log_path=ACTIVITY_LOG_PATH):
+    """Load the calendar for writing, catching up on days only the log has.
+
+    Covers the first run and any earlier run whose save failed. Read-only
+    queries should use ActivityCalendar.load directly.
+    """
+    path = Path(path)
+    calendar = ActivityCalendar.load(path) if path.exists() else ActivityCalendar()
+
+    added = calendar.sync_from_log(log_path)
+    if added:
+        print(f"ℹ️  Backfilled {added} day(s) from {log_path} into {path}")
+    return calendar
+
+
+def main():
+    """Print streak and density statistics for the default learner"""
+
+    today = datetime.now().date()
+
+    if not CALENDAR_PATH.exists():
+        print("ℹ️  No activity recorded yet")
+        return
+
+    calendar = ActivityCalendar.load(CALENDAR_PATH)
+    if DEFAULT_LEARNER not in calendar.learners:
+        print("ℹ️  No activity recorded yet")
+        return
+
+    month_start = today.replace(day=1)
+    missed = calendar.missed_days(month_start, today)
+
+    print(f"📅 Activity calendar for {today.strftime('%Y-%m-%d')}")
+    print(f"   Current streak: {calendar.current_streak(today)} days")
+    print(f"   Longest streak: {calendar.longest_streak()} days")
+    print(f"   Active this month: {calendar.active_count(month_start, today)}/{today.day} days")
+    if missed:
+        print(f"   Missed this month: {', '.join(d.strftime('%Y-%m-%d') for d in missed)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,425 @@
+"""
+Content Enrichment
+Sends LinkedIn post and image prompts to an OpenAI-compatible endpoint with batching,
+pooled connections, rate limiting and a content-addressed response cache
+"""
+
+import asyncio
+import base64
+import hashlib
+import http.client
+import json
+import os
+import random
+import time
+import urllib.request
+from pathlib import Path
+from urllib.parse import urlsplit
+
+# ============================================
+# CONFIGURATION
+# ============================================
+
+# Enrichment is skipped entirely when no endpoint is configured
+API_BASE = os.environ.get("CONTENT_API_BASE", "")
+API_KEY = os.environ.get("CONTENT_API_KEY", "")
+TEXT_MODEL = os.environ.get("CONTENT_TEXT_MODEL", "gpt-4o-mini")
+IMAGE_MODEL = os.environ.get("CONTENT_IMAGE_MODEL", "gpt-image-1")
+IMAGE_SIZE = os.environ.get("CONTENT_IMAGE_SIZE", "1024x1024")
+
+BATCH_SIZE = int(os.environ.get("CONTENT_BATCH_SIZE", "8"))
+MAX_CONNECTIONS = int(os.environ.get("CONTENT_MAX_CONNECTIONS", "4"))
+REQUESTS_PER_MINUTE = float(os.environ.get("CONTENT_REQUESTS_PER_MINUTE", "60"))
+REQUEST_TIMEOUT = float(os.environ.get("CONTENT_REQUEST_TIMEOUT", "120"))
+MAX_RETRIES = 3
+RETRY_BACKOFF = 1.0     # seconds; doubled on each retry
+
+CACHE_DIR = Path("content_cache")
+
+POST_TEMPLATE = """Write a LinkedIn post (120-180 words) about what I learned today.
+
+Topic: {topic}
+Domain: {domain}
+Difficulty: {difficulty}
+Notes: {deep}
+
+Open with a one-line hook, explain the core idea in plain language, give one
+practical example, and end with a question for readers. Use a friendly,
+professional tone, at most two emojis, and finish with 3-5 relevant hashtags
+including #LearningInPublic."""
+
+# Also written verbatim to linkedin_image_prompt.txt, so the committed prompt
+# is exactly what was sent
+IMAGE_TEMPLATE = """Create a clean LinkedIn post image illustrating "{topic}" ({domain}).
+Visualize the core idea: {short}
+Style: minimal, professional flat illustration, soft neutral background,
+one accent color, no text other than the topic title."""
+
+TEMPLATES = {
+    "post": POST_TEMPLATE,
+    "image": IMAGE_TEMPLATE,
+}
+
+
+class ContentAPIError(Exception):
+    """Raised when the content endpoint returns an unusable response"""
+
+
+def is_enabled():
+    """Check whether an enrichment endpoint is configured"""
+    return bool(API_BASE)
+
+
+def render_prompt(kind, job):
+    """Fill a prompt template from a topic job"""
+    return TEMPLATES[kind].format(**job)
+
+
+def _model_settings(kind):
+    """Request settings besides the prompt that shape a result"""
+    if kind == "post":
+        return TEXT_MODEL
+    return f"{IMAGE_MODEL}\0{IMAGE_SIZE}"
+
+
+def template_hash(kind):
+    """Fingerprint of a template together with its model (and image size)"""
+    material = f"{TEMPLATES[kind]}\0{_model_settings(kind)}"
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def cache_key(kind, job):
+    """Content address for a rendered prompt plus the model settings.
+
+    Repeated topics share an entry, while editing a topic's description, the
+    template, the model or the image size addresses a new one.
+    """
+    material = f"{kind}\0{render_prompt(kind, job)}\0{_model_settings(kind)}"
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+# ============================================
+# RESPONSE CACHE
+# ============================================
+
+class ResponseCache:
+    """Content-addressed store: <dir>/<key[:2]>/<key>.json (+ .png for images)"""
+
+    def __init__(self, root=CACHE_DIR):
+        self.root = Path(root)
+
+    def _path(self, key, suffix):
+        return self.root / key[:2] / f"{key}{suffix}"
+
+    def get(self, key):
+        """Return the cached result for a key, or None"""
+        meta_path = self._path(key, ".json")
+        if not meta_path.exists():
+            return None
+
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        if meta["kind"] == "image":
+            image_path = self._path(key, ".png")
+            if not image_path.exists():
+                return None
+            meta["image"] = image_path.read_bytes()
+        return meta
+
+    def put(self, key, meta):
+        """Store a result; image bytes are written next to the metadata"""
+        meta_path = self._path(key, ".json")
+        meta_path.parent.mkdir(parents=True, exist_ok=True)
+
+        meta = dict(meta)
+        image = meta.pop("image", None)
+        if image is not None:
+            self._path(key, ".png").write_bytes(image)
+            meta["file"] = f"{key}.png"
+
+        # Write-then-rename so a crash never leaves a half-written entry
+        tmp_path = meta_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(meta, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+        tmp_path.replace(meta_path)
+
+
+# ============================================
+# TRANSPORT
+# ============================================
+
+class RateLimiter:
+    """Token bucket shared by all in-flight requests"""
+
+    def __init__(self, per_minute, burst):
+        self.interval = 60.0 / per_minute
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) / self.interval)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) * self.interval)
+
+
+class ConnectionPool:
+    """Fixed-size pool of keep-alive HTTP connections.
+
+    http.client is blocking, so each request runs in a worker thread while the
+    event loop keeps the other connections busy.
+    """
+
+    def __init__(self, base_url, size=MAX_CONNECTIONS, timeout=REQUEST_TIMEOUT):
+        parts = urlsplit(base_url)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported endpoint URL: {base_url}")
+
+        self.scheme = parts.scheme
+        self.host = parts.hostname
+        self.port = parts.port
+        self.prefix = parts.path.rstrip("/")
+        self.timeout = timeout
+        self.headers = {"Content-Type": "application/json"}
+        if API_KEY:
+            self.headers["Authorization"] = f"Bearer {API_KEY}"
+
+        # Connections are opened lazily; None marks a free slot
+        self.idle = asyncio.Queue()
+        for _ in range(size):
+            self.idle.put_nowait(None)
+
+    def _connect(self):
+        if self.scheme == "https":
+            return http.client.HTTPSConnection(self.host, self.port, timeout=self.timeout)
+        return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+
+    def _send(self, conn, path, body):
+        conn.request("POST", self.prefix + path, body=body, headers=self.headers)
+        response = conn.getresponse()
+        return response.status, response.read()
+
+    async def post_json(self, path, payload):
+        """POST a JSON payload and return (status, decoded body)"""
+        conn = await self.idle.get()
+        try:
+            if conn is None:
+                conn = self._connect()
+            body = json.dumps(payload).encode("utf-8")
+            status, data = await asyncio.to_thread(self._send, conn, path, body)
+        except Exception:
+            # Drop the broken connection; the slot reconnects on next use
+            if conn is not None:
+                conn.close()
+            conn = None
+            raise
+        finally:
+            self.idle.put_nowait(conn)
+
+        try:
+            return status, json.loads(data.decode("utf-8") or "{}")
+        except ValueError:
+            return status, {"error": data.decode("utf-8", "replace")}
+
+    def close(self):
+        while not self.idle.empty():
+            conn = self.idle.get_nowait()
+            if conn is not None:
+                conn.close()
+
+
+# ============================================
+# GENERATION
+# ============================================
+
+# HTTP(S)-only opener, so redirects cannot reach file:// or ftp:// either
+_IMAGE_OPENER = urllib.request.OpenerDirector()
+for _handler in (
+    urllib.request.HTTPHandler,
+    urllib.request.HTTPSHandler,
+    urllib.request.HTTPRedirectHandler,
+    urllib.request.HTTPDefaultErrorHandler,
+    urllib.request.HTTPErrorProcessor,
+    urllib.request.UnknownHandler,
+):
+    _IMAGE_OPENER.add_handler(_handler())
+
+class ContentGenerator:
+    """Batches prompt requests, serving repeats from the cache"""
+
+    def __init__(self, pool, limiter, cache):
+        self.pool = pool
+        self.limiter = limiter
+        self.cache = cache
+
+    async def _call(self, path, payload):
+        for attempt in range(MAX_RETRIES + 1):
+            await self.limiter.acquire()
+            try:
+                status, data = await self.pool.post_json(path, payload)
+            except (OSError, http.client.HTTPException) as e:
+                if attempt == MAX_RETRIES:
+                    raise ContentAPIError(f"{path}: {e}") from e
+            else:
+                if status < 400:
+                    return data
+                if (status != 429 and status < 500) or attempt == MAX_RETRIES:
+                    error = data.get("error") if isinstance(data, dict) else data
+                    raise ContentAPIError(f"{path}: HTTP {status} {error}")
+
+            # Exponential backoff with jitter for 429/5xx and dropped connections
+            await asyncio.sleep(RETRY_BACKOFF * (2 ** attempt + random.random()))
+
+    async def _download(self, url):
+        """Fetch a generated image; hosted image URLs expire, so only bytes are cached"""
+        # The URL comes from the API response: never let it reach file:// or ftp://
+        if urlsplit(url).scheme not in ("http", "https"):
+            raise ContentAPIError(f"Refusing to download image from non-HTTP URL: {url}")
+
+        def fetch():
+            with _IMAGE_OPENER.open(url, timeout=REQUEST_TIMEOUT) as response:
+                return response.read()
+
+        await self.limiter.acquire()
+        try:
+            return await asyncio.to_thread(fetch)
+        except OSError as e:
+            raise ContentAPIError(f"Could not download image {url}: {e}") from e
+
+    async def _generate(self, kind, job):
+        prompt = render_prompt(kind, job)
+
+        if kind == "post":
+            data = await self._call("/chat/completions", {
+                "model": TEXT_MODEL,
+                "messages": [{"role": "user", "content": prompt}],
+            })
+            try:
+                return {"content": data["choices"][0]["message"]["content"].strip()}
+            except (KeyError, IndexError, TypeError, AttributeError):
+                raise ContentAPIError("Malformed chat completion response")
+
+        data = await self._call("/images/generations", {
+            "model": IMAGE_MODEL,
+            "prompt": prompt,
+            "n": 1,
+            "size": IMAGE_SIZE,
+        })
+        try:
+            item = data["data"][0]
+        except (KeyError, IndexError, TypeError):
+            raise ContentAPIError("Malformed image generation response")
+        if not isinstance(item, dict):
+            raise ContentAPIError("Malformed image generation response")
+        if item.get("b64_json"):
+            try:
+                return {"image": base64.b64decode(item["b64_json"], validate=True)}
+            except ValueError:
+                raise ContentAPIError("Image response has invalid base64 data")
+        if item.get("url"):
+            return {"image": await self._download(item["url"])}
+        raise ContentAPIError("Image response has neither b64_json nor url")
+
+    async def _resolve(self, key, kind, job):
+        result = await self._generate(kind, job)
+        meta = {
+            "kind": kind,
+            "topic": job["topic"],
+            "template": template_hash(kind),
+            "model": TEXT_MODEL if kind == "post" else IMAGE_MODEL,
+            **result,
+        }
+        self.cache.put(key, meta)
+        return meta
+
+    async def run(self, requests):
+        """Resolve (kind, job) requests; returns {cache key: result or None}"""
+        results = {}
+        pending = {}
+
+        for kind, job in requests:
+            key = cache_key(kind, job)
+            if key in results or key in pending:
+                continue
+            cached = self.cache.get(key)
+            if cached is not None:
+                results[key] = cached
+            else:
+                pending[key] = (kind, job)
+
+        if pending:
+            print(f"🌐 Requesting {len(pending)} item(s), {len(results)} served from cache")
+
+        items = list(pending.items())
+        for start in range(0, len(items), BATCH_SIZE):
+            batch = items[start:start + BATCH_SIZE]
+            outcomes = await asyncio.gather(
+                *(self._resolve(key, kind, job) for key, (kind, job) in batch),
+                return_exceptions=True,
+            )
+            for (key, (kind, job)), outcome in zip(batch, outcomes):
+                if isinstance(outcome, Exception):
+                    print(f"⚠️  Warning: Could not generate {kind} for {job['topic']}: {outcome}")
+                    outcome = None
+                results[key] = outcome
+
+        return results
+
+
+async def _enrich(jobs, kinds, base_url, cache_dir):
+    pool = ConnectionPool(base_url, size=MAX_CONNECTIONS, timeout=REQUEST_TIMEOUT)
+    limiter = RateLimiter(REQUESTS_PER_MINUTE, burst=MAX_CONNECTIONS)
+    generator = ContentGenerator(pool, limiter, ResponseCache(cache_dir))
+
+    try:
+        requests = [(kind, job) for job in jobs for kind in kinds]
+        results = await generator.run(requests)
+    finally:
+        pool.close()
+
+    return [
+        {kind: results.get(cache_key(kind, job)) for kind in kinds}
+        for job in jobs
+    ]
+
+
+def enrich(jobs, kinds=("post", "image"), base_url=None, cache_dir=CACHE_DIR):
+    """Generate content for each job.
+
+    Each job is a dict with ``topic``, ``domain``, ``difficulty``, ``short``
+    and ``deep`` keys. Returns one ``{kind: result or None}`` dict per job,
+    where a post result carries ``content`` and an image result carries
+    ``image`` bytes.
+    """
+    return asyncio.run(_enrich(jobs, kinds, base_url or API_BASE, cache_dir))
+
+
+def main():
+    """Pre-warm the cache for every topic in the learning pools"""
+
+    from update_learning import AI_TOPICS, DSA_TOPICS, SYSTEM_DESIGN_TOPICS
+
+    if not is_enabled():
+        print("ℹ️  CONTENT_API_BASE not set, nothing to do")
+        return
+
+    domains = {
+        "AI": AI_TOPICS,
+        "DSA": DSA_TOPICS,
+        "System Design": SYSTEM_DESIGN_TOPICS
+    }
+    jobs = [dict(entry, domain=domain) for domain, pool in domains.items() for entry in pool]
+
+    print(f"🎨 Enriching {len(jobs)} topics via {API_BASE}")
+    results = enrich(jobs)
+
+    done = sum(1 for result in results for item in result.values() if item is not None)
+    print(f"✅ {done}/{len(results) * 2} items available in {CACHE_DIR}")
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,8 @@ Tracks daily automation activity with better formatting and statistics
 from datetime import datetime
 from pathlib import Path
 
+from activity_calendar import CALENDAR_PATH, sync_calendar
+
 def main():
     """Update activity log with current timestamp"""
     
@@ -30,15 +32,23 @@ def main():
     content = activity_log.read_text(encoding="utf-8")
     if f"- **{date_str}**" in content:
         print(f"✅ Activity for {date_str} already logged")
-        return
-    
-    # Append new activity
-    entry = f"- **{date_str}** ({day_name}) - Activity logged at {timestamp}\n"
-    
-    with activity_log.open("a", encoding="utf-8") as f:
-        f.write(entry)
-    
-    print(f"✅ Activity logged successfully")
+    else:
+        # Append new activity
+        entry = f"- **{date_str}** ({day_name}) - Activity logged at {timestamp}\n"
+        
+        with activity_log.open("a", encoding="utf-8") as f:
+            f.write(entry)
+        
+        print(f"✅ Activity logged successfully")
+    
+    # Keep the bitset calendar in sync (catches up on any days only the log has)
+    try:
+        calendar = sync_calendar(CALENDAR_PATH, activity_log)
+        calendar.mark(now.date())
+        calendar.save(CALENDAR_PATH)
+        print(f"✅ Updated {CALENDAR_PATH} (current streak: {calendar.current_streak(now.date())} days)")
+    except Exception as e:
+        print(f"⚠️  Warning: Could not update activity calendar: {e}")
 
 if __name__ == "__main__":
     main()
@@ -8,6 +8,8 @@ import sys
 from datetime import datetime
 from pathlib import Path
 
+import enrich_content
+
 # ============================================
 # CONFIGURATION
 # ============================================
@@ -356,6 +358,7 @@ def main():
     activity_log = Path("activity_log.md")
     linkedin_post = Path("linkedin_post.md")
     linkedin_prompt = Path("linkedin_image_prompt.txt")
+    linkedin_image = Path("linkedin_image.png")
     
     # ============================================
     # IDEMPOTENCY CHECK
@@ -438,11 +441,11 @@ Today I explored **{selected['topic']}** ({domain}).
     # CREATE IMAGE PROMPT
     # ============================================
     
+    # Same prompt enrichment sends, so the file always describes the image
+    job = dict(selected, domain=domain)
+    
     try:
-        prompt_content = f"""Create a clean LinkedIn post image.
-Topic: {selected['topic']}
-Domain: {domain}
-Style: Minimal, professional, flat illustration."""
+        prompt_content = enrich_content.render_prompt("image", job)
         
         linkedin_prompt.write_text(prompt_content, encoding="utf-8")
         print(f"✅ Created {linkedin_prompt}")
@@ -450,6 +453,36 @@ Style: Minimal, professional, flat illustration."""
     except Exception as e:
         print(f"⚠️  Warning: Could not create image prompt: {e}")
     
+    # ============================================
+    # CONTENT ENRICHMENT (OPTIONAL)
+    # ============================================
+    
+    image = None
+    
+    if enrich_content.is_enabled():
+        try:
+            result = enrich_content.enrich([job])[0]
+            image = result["image"]
+            
+            if result["post"]:
+                linkedin_post.write_text(result["post"]["content"] + "\n", encoding="utf-8")
+                print(f"✅ Enriched {linkedin_post}")
+            
+        except Exception as e:
+            print(f"⚠️  Warning: Could not enrich LinkedIn content: {e}")
+    
+    # Never leave a previous day's image next to today's post
+    try:
+        if image:
+            linkedin_image.write_bytes(image["image"])
+            print(f"✅ Created {linkedin_image}")
+        elif linkedin_image.exists():
+            linkedin_image.unlink()
+            print(f"🧹 Removed stale {linkedin_image}")
+        
+    except Exception as e:
+        print(f"⚠️  Warning: Could not update {linkedin_image}: {e}")
+    
     # ============================================
     # WEEKLY SUMMARY PLACEHOLDER
     # ============================================
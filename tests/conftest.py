@@ -0,0 +1,9 @@
+"""
+Test configuration
+Makes the standalone scripts importable the same way `python scripts/<name>.py` does
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
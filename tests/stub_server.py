@@ -0,0 +1,124 @@
+"""
+Stand-in Content Server
+Minimal OpenAI-compatible endpoint for exercising enrich_content without network access
+"""
+
+import base64
+import json
+import threading
+import time
+from collections import defaultdict, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+PNG_BYTES = b"\x89PNG\r\n\x1a\nstub-image"
+
+
+def chat_response(content):
+    return {"choices": [{"message": {"role": "assistant", "content": content}}]}
+
+
+def image_response(data=PNG_BYTES):
+    return {"data": [{"b64_json": base64.b64encode(data).decode("ascii")}]}
+
+
+class StubServer:
+    """Threaded HTTP/1.1 server answering /v1/chat/completions and /v1/images/generations.
+
+    By default every request succeeds. Queue scripted replies per path with
+    ``script(path, *replies)``; each reply is either ``(status, body)`` or the
+    string ``"drop"`` to close the connection without answering. Plain GET
+    requests serve files registered in ``files`` (for image URL downloads).
+    """
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.scripts = defaultdict(deque)
+        self.files = {}
+        self.calls = []
+        self.connections = set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True)
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server.server_port}"
+
+    @property
+    def base_url(self):
+        return f"{self.url}/v1"
+
+    def script(self, path, *replies):
+        self.scripts[path].extend(replies)
+
+    def calls_to(self, path):
+        return [body for call_path, body in self.calls if call_path == path]
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _next_reply(self, path, body):
+        with self.lock:
+            if self.scripts[path]:
+                return self.scripts[path].popleft()
+
+        if path == "/v1/chat/completions":
+            return 200, chat_response(f"Draft: {body['messages'][0]['content'][:40]}")
+        if path == "/v1/images/generations":
+            return 200, image_response()
+        return 404, {"error": {"message": f"Unknown path {path}"}}
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status, payload, content_type="application/json"):
+                if not isinstance(payload, bytes):
+                    payload = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_GET(self):
+                if self.path in stub.files:
+                    self._send(200, stub.files[self.path], "image/png")
+                else:
+                    self._send(404, {"error": "not found"})
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+
+                with stub.lock:
+                    stub.calls.append((self.path, body))
+                    stub.connections.add(self.client_address)
+                    stub.in_flight += 1
+                    stub.max_in_flight = max(stub.max_in_flight, stub.in_flight)
+
+                try:
+                    time.sleep(stub.delay)
+                    reply = stub._next_reply(self.path, body)
+                finally:
+                    with stub.lock:
+                        stub.in_flight -= 1
+
+                if reply == "drop":
+                    self.close_connection = True
+                    return
+                self._send(*reply)
+
+        return Handler
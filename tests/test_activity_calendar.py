@@ -0,0 +1,185 @@
+"""
+Tests for the bitset activity calendar
+"""
+
+from datetime import date, timedelta
+
+import pytest
+
+from activity_calendar import ActivityCalendar, _longest_run, sync_calendar
+
+
+def make_calendar(*days):
+    calendar = ActivityCalendar()
+    for day in days:
+        calendar.mark(day)
+    return calendar
+
+
+def day_range(start, count):
+    return [start + timedelta(days=i) for i in range(count)]
+
+
+# ============================================
+# BIT HELPERS
+# ============================================
+
+@pytest.mark.parametrize("bits, expected", [
+    (0, 0),
+    (0b1, 1),
+    (0b1000, 1),
+    (0b1011, 2),
+    (0b1110111, 3),
+    (0b111101111111, 7),
+    ((1 << 100) - 1, 100),
+    (((1 << 37) - 1) << 200 | 0b11, 37),
+])
+def test_longest_run(bits, expected):
+    assert _longest_run(bits) == expected
+
+
+# ============================================
+# STREAKS
+# ============================================
+
+def test_current_streak_counts_back_from_today():
+    today = date(2026, 3, 2)
+    calendar = make_calendar(*day_range(today - timedelta(days=4), 5), date(2026, 2, 20))
+
+    assert calendar.current_streak(today) == 5
+    assert calendar.current_streak(today + timedelta(days=1)) == 0
+
+
+def test_current_streak_spans_month_and_year_boundaries():
+    calendar = make_calendar(*day_range(date(2025, 12, 29), 6))
+
+    assert calendar.current_streak(date(2026, 1, 3)) == 6
+
+
+def test_current_streak_before_first_activity():
+    calendar = make_calendar(date(2026, 2, 4))
+
+    assert calendar.current_streak(date(2026, 2, 2)) == 0
+    assert calendar.current_streak(date(2020, 1, 1)) == 0
+
+
+def test_current_streak_unknown_learner():
+    assert make_calendar(date(2026, 2, 4)).current_streak(date(2026, 2, 4), "nobody") == 0
+
+
+def test_longest_streak_with_and_without_range():
+    calendar = make_calendar(*day_range(date(2026, 1, 1), 10), *day_range(date(2026, 2, 1), 4))
+
+    assert calendar.longest_streak() == 10
+    assert calendar.longest_streak(start=date(2026, 1, 8)) == 4
+    assert calendar.longest_streak(end=date(2026, 1, 3)) == 3
+
+
+def test_mark_before_base_keeps_existing_days():
+    calendar = make_calendar(date(2026, 2, 14))
+    calendar.mark(date(2025, 6, 1))
+
+    assert calendar.is_active(date(2026, 2, 14))
+    assert calendar.is_active(date(2025, 6, 1))
+    assert not calendar.is_active(date(2025, 6, 2))
+
+
+# ============================================
+# GAPS AND DENSITY
+# ============================================
+
+def test_missed_days_includes_both_ends():
+    calendar = make_calendar(date(2026, 2, 2), date(2026, 2, 4))
+
+    assert calendar.missed_days(date(2026, 2, 1), date(2026, 2, 5)) == [
+        date(2026, 2, 1), date(2026, 2, 3), date(2026, 2, 5),
+    ]
+
+
+def test_missed_days_before_first_activity():
+    calendar = make_calendar(date(2026, 2, 4))
+
+    assert calendar.missed_days(date(2026, 1, 30), date(2026, 2, 4)) == day_range(date(2026, 1, 30), 5)
+
+
+def test_weekly_density_is_monday_aligned_and_clipped():
+    # 2026-02-01 is a Sunday, so it belongs to the week of 2026-01-26
+    calendar = make_calendar(date(2026, 1, 31), date(2026, 2, 1), *day_range(date(2026, 2, 2), 7))
+
+    density = calendar.weekly_density(date(2026, 2, 1), date(2026, 2, 10))
+
+    assert density == {
+        date(2026, 1, 26): 1,   # Saturday the 31st is outside the range
+        date(2026, 2, 2): 7,
+        date(2026, 2, 9): 0,
+    }
+
+
+def test_density_of_empty_range():
+    calendar = make_calendar(date(2020, 7, 6), date(2020, 7, 7))
+
+    assert calendar.weekly_density(date(2020, 7, 8), date(2020, 7, 7)) == {}
+    assert calendar.monthly_density(date(2020, 7, 8), date(2020, 7, 7)) == {}
+
+
+def test_monthly_density_at_month_edges():
+    calendar = make_calendar(date(2026, 1, 31), date(2026, 2, 1), date(2026, 2, 28), date(2026, 3, 1))
+
+    density = calendar.monthly_density(date(2026, 1, 31), date(2026, 3, 1))
+
+    assert density == {(2026, 1): 1, (2026, 2): 2, (2026, 3): 1}
+
+
+def test_monthly_density_across_year_end():
+    calendar = make_calendar(*day_range(date(2025, 12, 30), 4))
+
+    assert calendar.monthly_density(date(2025, 12, 1), date(2026, 1, 31)) == {(2025, 12): 2, (2026, 1): 2}
+
+
+# ============================================
+# PERSISTENCE
+# ============================================
+
+def test_save_and_load_round_trip(tmp_path):
+    calendar = make_calendar(date(2026, 2, 4), date(2026, 2, 9))
+    calendar.mark(date(2024, 5, 5), "other")
+    calendar.save(tmp_path / "calendar.bin")
+
+    assert ActivityCalendar.load(tmp_path / "calendar.bin").learners == calendar.learners
+
+
+def write_log(path, *days):
+    lines = [f"- **{day}** (Day) - Activity logged at {day} 09:00:00\n" for day in days]
+    path.write_text("# 📈 Activity Log\n\n" + "".join(lines), encoding="utf-8")
+
+
+def test_sync_calendar_backfills_days_missing_from_bitset(tmp_path):
+    log = tmp_path / "activity_log.md"
+    write_log(log, "2026-02-04", "2026-02-05", "2026-02-06")
+    # Simulate an earlier failed save: the bitset only knows the first day
+    make_calendar(date(2026, 2, 4)).save(tmp_path / "calendar.bin")
+
+    calendar = sync_calendar(tmp_path / "calendar.bin", log)
+
+    assert calendar.current_streak(date(2026, 2, 6)) == 3
+
+
+def test_sync_calendar_builds_from_log_on_first_run(tmp_path):
+    log = tmp_path / "activity_log.md"
+    write_log(log, "2026-02-04", "2026-02-05")
+
+    calendar = sync_calendar(tmp_path / "calendar.bin", log)
+
+    assert calendar.last_active() == date(2026, 2, 5)
+    assert calendar.active_count(date(2026, 2, 1), date(2026, 2, 28)) == 2
+
+
+def test_sync_from_log_stops_at_latest_active_day(tmp_path):
+    log = tmp_path / "activity_log.md"
+    write_log(log, "2026-02-04", "2026-02-05", "2026-02-06")
+    calendar = make_calendar(date(2026, 2, 5))
+
+    assert calendar.sync_from_log(log) == 1
+    # Entries at or before the high-water mark are not revisited
+    assert not calendar.is_active(date(2026, 2, 4))
+    assert calendar.sync_from_log(log) == 0
@@ -0,0 +1,232 @@
+"""
+Tests for content enrichment against the local stand-in server
+"""
+
+import pytest
+
+import enrich_content
+from stub_server import PNG_BYTES, StubServer, chat_response
+
+CHAT = "/v1/chat/completions"
+IMAGES = "/v1/images/generations"
+
+
+def make_job(topic="Bloom Filters"):
+    return {
+        "topic": topic,
+        "domain": "DSA",
+        "difficulty": "Intermediate",
+        "short": f"{topic} in one line.",
+        "deep": f"{topic} in a few more words.",
+        "link": "https://example.com",
+    }
+
+
+@pytest.fixture(autouse=True)
+def fast_settings(monkeypatch):
+    monkeypatch.setattr(enrich_content, "RETRY_BACKOFF", 0)
+    monkeypatch.setattr(enrich_content, "REQUESTS_PER_MINUTE", 60000)
+    monkeypatch.setattr(enrich_content, "REQUEST_TIMEOUT", 5)
+
+
+@pytest.fixture
+def stub():
+    with StubServer() as server:
+        yield server
+
+
+@pytest.fixture
+def run(stub, tmp_path):
+    def run(jobs, kinds=("post", "image")):
+        return enrich_content.enrich(jobs, kinds, base_url=stub.base_url, cache_dir=tmp_path)
+    return run
+
+
+# ============================================
+# HAPPY PATH AND CACHE
+# ============================================
+
+def test_generates_post_and_image(stub, run):
+    job = make_job()
+
+    [result] = run([job])
+
+    assert result["post"]["content"].startswith("Draft: ")
+    assert result["image"]["image"] == PNG_BYTES
+    assert stub.calls_to(IMAGES)[0]["prompt"] == enrich_content.render_prompt("image", job)
+
+
+def test_repeat_topics_are_served_from_cache(stub, run):
+    run([make_job()])
+    calls = len(stub.calls)
+
+    [result] = run([make_job()])
+
+    assert len(stub.calls) == calls
+    assert result["image"]["image"] == PNG_BYTES
+
+
+def test_duplicate_topics_in_one_run_are_requested_once(stub, run):
+    results = run([make_job(), make_job(), make_job("Tries")], kinds=("post",))
+
+    assert len(stub.calls_to(CHAT)) == 2
+    assert results[0] == results[1]
+
+
+@pytest.mark.parametrize("setting, value", [
+    ("TEXT_MODEL", "other-text-model"),
+    ("IMAGE_MODEL", "other-image-model"),
+    ("IMAGE_SIZE", "512x512"),
+])
+def test_model_and_size_changes_bypass_cache(stub, run, monkeypatch, setting, value):
+    run([make_job()])
+    calls = len(stub.calls)
+
+    monkeypatch.setattr(enrich_content, setting, value)
+    run([make_job()])
+
+    assert len(stub.calls) == calls + 1
+
+
+def test_edited_topic_description_bypasses_cache(stub, run):
+    run([make_job()])
+    calls = len(stub.calls)
+
+    edited = dict(make_job(), short="A rewritten one-liner.", deep="A rewritten explanation.")
+    run([edited])
+
+    assert len(stub.calls) == calls + 2
+
+
+# ============================================
+# BATCHING AND CONNECTIONS
+# ============================================
+
+def test_batches_bound_concurrency_and_reuse_connections(tmp_path, monkeypatch):
+    monkeypatch.setattr(enrich_content, "BATCH_SIZE", 2)
+    monkeypatch.setattr(enrich_content, "MAX_CONNECTIONS", 2)
+    jobs = [make_job(f"Topic {i}") for i in range(6)]
+
+    with StubServer(delay=0.05) as stub:
+        results = enrich_content.enrich(jobs, ("post",), base_url=stub.base_url, cache_dir=tmp_path)
+
+    assert all(result["post"] for result in results)
+    assert len(stub.calls) == 6
+    assert stub.max_in_flight == 2
+    assert len(stub.connections) <= 2
+
+
+# ============================================
+# RETRIES AND FAILURES
+# ============================================
+
+def test_retries_rate_limit_and_server_errors(stub, run):
+    stub.script(CHAT, (429, {"error": "slow down"}), (503, {"error": "busy"}))
+
+    [result] = run([make_job()], kinds=("post",))
+
+    assert result["post"] is not None
+    assert len(stub.calls_to(CHAT)) == 3
+
+
+def test_recovers_from_dropped_connection(stub, run):
+    stub.script(CHAT, "drop")
+
+    [result] = run([make_job()], kinds=("post",))
+
+    assert result["post"] is not None
+    assert len(stub.calls_to(CHAT)) == 2
+
+
+def test_gives_up_after_max_retries_without_caching(stub, run):
+    stub.script(CHAT, *[(500, {"error": "down"})] * (enrich_content.MAX_RETRIES + 1))
+
+    [result] = run([make_job()], kinds=("post",))
+    assert result["post"] is None
+    assert len(stub.calls_to(CHAT)) == enrich_content.MAX_RETRIES + 1
+
+    [result] = run([make_job()], kinds=("post",))
+    assert result["post"] is not None
+
+
+def test_client_errors_are_not_retried(stub, run):
+    stub.script(CHAT, (400, ["not", "an", "object"]))
+
+    [result] = run([make_job()], kinds=("post",))
+
+    assert result["post"] is None
+    assert len(stub.calls_to(CHAT)) == 1
+
+
+@pytest.mark.parametrize("path, body", [
+    (CHAT, {"choices": []}),
+    (CHAT, {"choices": [{"message": {}}]}),
+    (CHAT, ["not", "an", "object"]),
+    (IMAGES, {"data": []}),
+    (IMAGES, {"data": [{}]}),
+    (IMAGES, {"data": [{"b64_json": "!!not base64!!"}]}),
+    (IMAGES, "just a string"),
+])
+def test_malformed_responses_fail_only_that_item(stub, run, path, body):
+    stub.script(path, (200, body))
+
+    [result] = run([make_job()])
+
+    failed = "post" if path == CHAT else "image"
+    assert result[failed] is None
+    assert all(result[kind] is not None for kind in result if kind != failed)
+
+
+def test_failures_do_not_affect_rest_of_batch(stub, run):
+    stub.script(CHAT, (200, {"choices": []}))
+
+    results = run([make_job("A"), make_job("B"), make_job("C")], kinds=("post",))
+
+    assert sum(result["post"] is None for result in results) == 1
+
+
+# ============================================
+# IMAGE URLS
+# ============================================
+
+def test_image_urls_are_downloaded_before_caching(stub, run):
+    stub.files["/files/image.png"] = PNG_BYTES
+    stub.script(IMAGES, (200, {"data": [{"url": f"{stub.url}/files/image.png"}]}))
+
+    [result] = run([make_job()], kinds=("image",))
+    del stub.files["/files/image.png"]  # the hosted URL expires
+
+    assert result["image"]["image"] == PNG_BYTES
+    [cached] = run([make_job()], kinds=("image",))
+    assert cached["image"]["image"] == PNG_BYTES
+    assert len(stub.calls_to(IMAGES)) == 1
+
+
+def test_failed_image_download_is_not_cached(stub, run):
+    stub.script(IMAGES, (200, {"data": [{"url": f"{stub.url}/files/missing.png"}]}))
+
+    [result] = run([make_job()], kinds=("image",))
+    assert result["image"] is None
+
+    [result] = run([make_job()], kinds=("image",))
+    assert result["image"]["image"] == PNG_BYTES
+    assert len(stub.calls_to(IMAGES)) == 2
+
+
+@pytest.mark.parametrize("url", ["file:///etc/hostname", "ftp://127.0.0.1/image.png"])
+def test_non_http_image_urls_are_rejected(stub, run, tmp_path, url):
+    stub.script(IMAGES, (200, {"data": [{"url": url}]}))
+
+    [result] = run([make_job()], kinds=("image",))
+
+    assert result["image"] is None
+    assert not list(tmp_path.rglob("*.json"))
+    assert not list(tmp_path.rglob("*.png"))
+
+
+def test_chat_response_helper_round_trips(stub, run):
+    stub.script(CHAT, (200, chat_response("  Hello LinkedIn  ")))
+
+    [result] = run([make_job()], kinds=("post",))
+
+    assert result["post"]["content"] == "Hello LinkedIn"
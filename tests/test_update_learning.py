@@ -0,0 +1,47 @@
+"""
+Tests for the LinkedIn outputs written by the learning update
+"""
+
+import pytest
+
+import enrich_content
+import update_learning
+from stub_server import PNG_BYTES, StubServer
+
+
+@pytest.fixture(autouse=True)
+def workdir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(enrich_content, "RETRY_BACKOFF", 0)
+    return tmp_path
+
+
+def test_prompt_file_matches_prompt_sent(workdir, monkeypatch):
+    with StubServer() as stub:
+        monkeypatch.setattr(enrich_content, "API_BASE", stub.base_url)
+        update_learning.main()
+
+    [sent] = stub.calls_to("/v1/images/generations")
+    assert (workdir / "linkedin_image_prompt.txt").read_text(encoding="utf-8") == sent["prompt"]
+    assert (workdir / "linkedin_image.png").read_bytes() == PNG_BYTES
+
+
+def test_stale_image_removed_when_enrichment_disabled(workdir, monkeypatch):
+    monkeypatch.setattr(enrich_content, "API_BASE", "")
+    (workdir / "linkedin_image.png").write_bytes(b"yesterday")
+
+    update_learning.main()
+
+    assert not (workdir / "linkedin_image.png").exists()
+
+
+def test_stale_image_removed_when_generation_fails(workdir, monkeypatch):
+    (workdir / "linkedin_image.png").write_bytes(b"yesterday")
+
+    with StubServer() as stub:
+        stub.script("/v1/images/generations", (400, {"error": "content policy"}))
+        monkeypatch.setattr(enrich_content, "API_BASE", stub.base_url)
+        update_learning.main()
+
+    assert not (workdir / "linkedin_image.png").exists()
+    assert (workdir / "linkedin_post.md").read_text(encoding="utf-8").startswith("Draft: ")